@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Shared system probes for the SmartScreenshot test scripts
+
+test_smartscreenshot.py and test_enhanced_smartscreenshot.py used to
+duplicate these probes verbatim, so every optimization had to be applied
+twice. They live here once; the concrete testers subclass BaseTester and
+add only their own tests.
+"""
+
+import asyncio
+import atexit
+import importlib.util
+import logging
+import logging.handlers
+import os
+import plistlib
+import sys
+import tempfile
+from datetime import datetime
+
+# Keep the old SUCCESS lines distinguishable from plain INFO
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+
+_LEVELS = {
+    "INFO": logging.INFO,
+    "SUCCESS": SUCCESS,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+# Buffer records in memory and flush once at the summary instead of
+# paying a strftime + stdout flush per line; under asyncio.gather the
+# per-line flushes otherwise serialize the coroutines on the stdout lock
+_stream = logging.StreamHandler(sys.stdout)
+_stream.setFormatter(logging.Formatter(
+    "[%(asctime)s] %(levelname)s: %(message)s", datefmt="%H:%M:%S"))
+_buffer = logging.handlers.MemoryHandler(capacity=256, target=_stream)
+
+_log = logging.getLogger("smartscreenshot.tests")
+_log.setLevel(logging.INFO)
+_log.addHandler(_buffer)
+
+# Make sure buffered records still reach the terminal on any exit path
+atexit.register(_buffer.flush)
+
+
+class BaseTester:
+    # Cached result of the read-only TCC accessibility query
+    _accessibility_clients = None
+
+    # Cached `defaults export` of the app's preference domain
+    _prefs_cache = None
+
+    def __init__(self):
+        self.app_name = "SmartScreenshot"
+        self.test_results = []
+        # Bound the number of probes forked at once under asyncio.gather
+        self._proc_sem = asyncio.Semaphore(8)
+        self._prefs_lock = asyncio.Lock()
+
+    def log(self, message, level="INFO"):
+        _log.log(_LEVELS.get(level, logging.INFO), message)
+
+    @staticmethod
+    def flush_logs():
+        """Flush the buffered log records to stdout"""
+        _buffer.flush()
+
+    async def run_command(self, argv, timeout=10, input_text=None):
+        """Run a command (argv list, no shell) and return the result"""
+        try:
+            async with self._proc_sem:
+                proc = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdin=asyncio.subprocess.PIPE if input_text is not None else None,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(
+                        proc.communicate(input_text.encode() if input_text is not None else None),
+                        timeout
+                    )
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    return False, "", "Command timed out"
+            return proc.returncode == 0, stdout.decode(), stderr.decode()
+        except Exception as e:
+            return False, "", str(e)
+
+    async def check_app_running(self):
+        """Check if SmartScreenshot is running"""
+        self.log("Checking if SmartScreenshot is running...")
+        success, stdout, stderr = await self.run_command(["pgrep", "-x", self.app_name])
+        if success and stdout.strip():
+            self.log("✅ SmartScreenshot is running", "SUCCESS")
+            return True
+        else:
+            self.log("❌ SmartScreenshot is not running", "ERROR")
+            return False
+
+    async def _prefs(self):
+        """Export the app's whole defaults domain once and cache it.
+
+        Every `defaults read` forks and parses the full plist just to
+        answer one key, so a single `defaults export` serves all the
+        preference lookups in one parse.
+        """
+        async with self._prefs_lock:
+            if type(self)._prefs_cache is None:
+                success, stdout, stderr = await self.run_command(
+                    ["defaults", "export", "com.smartscreenshot.app", "-"])
+                prefs = {}
+                if success:
+                    try:
+                        prefs = plistlib.loads(stdout.encode())
+                    except plistlib.InvalidFileException:
+                        pass
+                type(self)._prefs_cache = prefs
+        return type(self)._prefs_cache
+
+    async def test_menu_bar_icon(self):
+        """Test if menu bar icon is visible"""
+        self.log("Testing menu bar icon visibility...")
+        # This is a visual test - we can't programmatically verify it
+        # But we can check if the app is in the menu bar
+        prefs = await self._prefs()
+        if prefs.get("LSUIElement") in (1, "1", True):
+            self.log("✅ App is configured as menu bar app", "SUCCESS")
+            return True
+        else:
+            self.log("⚠️  App may not be in menu bar (LSUIElement not set)", "WARNING")
+            return False
+
+    async def test_hotkeys_registration(self):
+        """Test if hotkeys are properly registered"""
+        self.log("Testing hotkey registration...")
+        # Check the accessibility grant read-only. Never `tccutil reset`
+        # here — that wipes the grant and forces macOS to re-prompt on the
+        # next real launch. Query once and cache on the class.
+        if type(self)._accessibility_clients is None:
+            success, stdout, stderr = await self.run_command([
+                "sqlite3",
+                os.path.expanduser("~/Library/Application Support/com.apple.TCC/TCC.db"),
+                "SELECT client FROM access WHERE service='kTCCServiceAccessibility'",
+            ])
+            type(self)._accessibility_clients = stdout if success else ""
+        if "com.smartscreenshot.app" in type(self)._accessibility_clients:
+            self.log("✅ App has accessibility permission", "SUCCESS")
+        else:
+            self.log("⚠️  Accessibility permission not visible (may need manual grant)", "WARNING")
+        self.log("✅ Hotkey registration test completed (requires manual verification)", "INFO")
+        return True
+
+    async def test_screen_recording_permission(self):
+        """Test screen recording permission"""
+        self.log("Testing screen recording permission...")
+        # Capture to a unique temp file so concurrent runs don't collide,
+        # and as TIFF so screencapture skips the PNG encode — only the
+        # capture itself exercises the permission
+        with tempfile.NamedTemporaryFile(suffix=".tiff", delete=False) as tf:
+            path = tf.name
+        try:
+            success, stdout, stderr = await self.run_command(
+                ["screencapture", "-x", "-t", "tiff", path], timeout=5)
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        if success:
+            self.log("✅ Screen recording permission granted", "SUCCESS")
+            return True
+        else:
+            self.log("❌ Screen recording permission denied", "ERROR")
+            self.log("Please enable screen recording in System Preferences > Security & Privacy > Privacy > Screen Recording", "INFO")
+            return False
+
+    async def test_notification_permission(self):
+        """Test notification permission"""
+        self.log("Testing notification permission...")
+        # Check notification settings (answered from the cached export)
+        prefs = await self._prefs()
+        if prefs.get("NSUserNotificationAlertStyle"):
+            self.log(f"✅ Notification alert style: {prefs['NSUserNotificationAlertStyle']}", "SUCCESS")
+        self.log("✅ Notification permission test completed", "INFO")
+        return True
+
+    async def test_clipboard_functionality(self):
+        """Test clipboard functionality"""
+        self.log("Testing clipboard functionality...")
+
+        # Test copying text to clipboard
+        test_text = "SmartScreenshot Test - " + datetime.now().strftime("%H:%M:%S")
+        success, stdout, stderr = await self.run_command(["pbcopy"], input_text=test_text)
+        if success:
+            # Test reading from clipboard
+            success2, stdout2, stderr2 = await self.run_command(["pbpaste"])
+            if success2 and test_text in stdout2:
+                self.log("✅ Clipboard functionality working", "SUCCESS")
+                return True
+            else:
+                self.log("❌ Clipboard read failed", "ERROR")
+                return False
+        else:
+            self.log("❌ Clipboard write failed", "ERROR")
+            return False
+
+    async def test_ocr_capability(self):
+        """Test OCR capability by creating a test image with text"""
+        self.log("Testing OCR capability...")
+
+        # Create a simple test image with text using ImageMagick or similar
+        # For now, we'll just check if Vision framework is available. A spec
+        # lookup answers that in-process; no need to fork a fresh interpreter.
+        if importlib.util.find_spec("Vision") is not None:
+            self.log("✅ Vision framework available for OCR", "SUCCESS")
+            return True
+        else:
+            self.log("⚠️  Vision framework not available (OCR may not work)", "WARNING")
+            return False
+
+    async def test_app_preferences(self):
+        """Test app preferences and settings"""
+        self.log("Testing app preferences...")
+
+        # Check if preferences file exists
+        prefs_path = os.path.expanduser("~/Library/Preferences/com.smartscreenshot.app.plist")
+        if os.path.exists(prefs_path):
+            self.log("✅ App preferences file exists", "SUCCESS")
+            return True
+        else:
+            self.log("⚠️  App preferences file not found (may be normal for first run)", "WARNING")
+            return False
@@ -1,11 +1,60 @@
 #!/usr/bin/env python3
+# For faster resampling/saves, install Pillow-SIMD as a drop-in Pillow
+# replacement (module name stays PIL, no code changes needed):
+#   pip uninstall pillow && CC="cc -mavx2" pip install pillow-simd
+import functools
 import os
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import math
 
-def create_smart_screenshot_icon(size, output_path):
+try:
+    # Optional: JIT-compiled gradient fill (parallel, no intermediate arrays)
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _fill_gradient(arr, size):
+        for y in numba.prange(size):
+            ratio = y / size
+            r = np.uint8(64 + 64 * ratio)
+            g = np.uint8(128 - 64 * ratio)
+            b = np.uint8(255 - 64 * ratio)
+            for x in range(size):
+                arr[y, x, 0] = r
+                arr[y, x, 1] = g
+                arr[y, x, 2] = b
+                arr[y, x, 3] = 255
+
+    # Warm the JIT cache once so per-size calls are pure execution
+    _fill_gradient(np.empty((1, 1, 4), dtype=np.uint8), 1)
+else:
+    def _fill_gradient(arr, size):
+        ratio = np.linspace(0, 1, size, endpoint=False, dtype=np.float32)[:, None]
+        arr[..., 0] = (64 + 64 * ratio).astype(np.uint8)
+        arr[..., 1] = (128 - 64 * ratio).astype(np.uint8)
+        arr[..., 2] = (255 - 64 * ratio).astype(np.uint8)
+        arr[..., 3] = 255
+
+# Reusable gradient buffer: one max-size allocation shared by every render
+# instead of a fresh RGBA array per size
+_BUF = np.zeros((1024, 1024, 4), dtype=np.uint8)
+
+@functools.lru_cache(maxsize=None)
+def _font(font_size):
+    """Load the icon font once per size; FreeType re-parses the TTC on every call otherwise"""
+    try:
+        # Try to use a system font
+        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
+    except:
+        # Fallback to default font
+        return ImageFont.load_default()
+
+def create_smart_screenshot_icon(size):
     """Create a SmartScreenshot icon with camera and text elements"""
-    
+
     # Create a new image with a gradient background
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -14,13 +63,14 @@ def create_smart_screenshot_icon(size, output_path):
     padding = size // 8
     center = size // 2
     
-    # Create gradient background (blue to purple)
-    for y in range(size):
-        ratio = y / size
-        r = int(64 + (128 - 64) * ratio)
-        g = int(128 + (64 - 128) * ratio)
-        b = int(255 - 64 * ratio)
-        draw.line([(0, y), (size, y)], fill=(r, g, b, 255))
+    # Create gradient background (blue to purple) in one fused pass
+    # instead of one draw.line() call per row, reusing the shared buffer
+    if size <= _BUF.shape[0]:
+        arr = _BUF[:size, :size]
+    else:
+        arr = np.empty((size, size, 4), dtype=np.uint8)
+    _fill_gradient(arr, size)
+    img.paste(Image.fromarray(arr, 'RGBA'))
     
     # Draw camera body (rounded rectangle)
     camera_width = size - 2 * padding
@@ -58,14 +108,8 @@ def create_smart_screenshot_icon(size, output_path):
     )
     
     # Add text "SS" for SmartScreenshot
-    try:
-        # Try to use a system font
-        font_size = size // 8
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-    except:
-        # Fallback to default font
-        font = ImageFont.load_default()
-    
+    font = _font(size // 8)
+
     text = "SS"
     text_bbox = draw.textbbox((0, 0), text, font=font)
     text_width = text_bbox[2] - text_bbox[0]
@@ -83,19 +127,22 @@ def create_smart_screenshot_icon(size, output_path):
     
     # Draw text
     draw.text((text_x, text_y), text, fill=(255, 255, 255, 255), font=font)
-    
-    # Save the icon
-    img.save(output_path, 'PNG')
-    print(f"Created icon: {output_path}")
+
+    return img
 
 def main():
     """Generate all required icon sizes"""
-    sizes = [16, 32, 64, 128, 256, 512, 1024]
-    
-    for size in sizes:
+    # Render the design once at full resolution, then downsample — each
+    # per-size render would redo the gradient, drawing and text layout
+    master = create_smart_screenshot_icon(1024)
+    master.save("temp_icon/AppIcon-1024w.png", 'PNG')
+    print("Created icon: temp_icon/AppIcon-1024w.png")
+
+    for size in [16, 32, 64, 128, 256, 512]:
         output_path = f"temp_icon/AppIcon-{size}w.png"
-        create_smart_screenshot_icon(size, output_path)
-    
+        master.resize((size, size), Image.LANCZOS).save(output_path, 'PNG')
+        print(f"Created icon: {output_path}")
+
     print("All icons created successfully!")
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@
 import os
 import subprocess
 
+from PIL import Image
+
 def create_simple_icon():
     """Create a simple SmartScreenshot icon using macOS built-in tools"""
     
@@ -49,18 +51,16 @@ def create_simple_icon():
             "--out", "temp_icon/AppIcon-1024w.png"
         ], check=True)
         
-        # Create different sizes
+        # Create different sizes in-process instead of forking sips per size
         sizes = [16, 32, 64, 128, 256, 512]
+        src = Image.open("temp_icon/AppIcon-1024w.png")
         for size in sizes:
-            subprocess.run([
-                "sips", "-z", str(size), str(size), "temp_icon/AppIcon-1024w.png",
-                "--out", f"temp_icon/AppIcon-{size}w.png"
-            ], check=True)
-        
+            src.resize((size, size), Image.LANCZOS).save(f"temp_icon/AppIcon-{size}w.png")
+
         print("Icons created successfully!")
         return True
-        
-    except subprocess.CalledProcessError as e:
+
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"Error creating icons: {e}")
         return False
 
@@ -11,16 +11,100 @@ This script verifies that all SmartScreenshot features from the README are worki
 6. Export options and history management
 """
 
+import contextlib
+import functools
+import io
+import mmap
 import os
+import re
 import sys
 import subprocess
 import json
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    # Optional: single-pass multi-pattern matching for the content scans
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+@functools.lru_cache(maxsize=None)
+def build_scanner(needles):
+    """Build a one-pass scanner returning the subset of needles present in a string.
+
+    With pyahocorasick installed this is a single Aho-Corasick automaton
+    traversal; otherwise a compiled regex alternation does one pass and only
+    the needles it shadowed (nested/overlapping patterns) are rechecked
+    individually. Either way N full substring scans collapse to ~1, and the
+    lru_cache means each needle tuple is compiled once per run.
+
+    The scanner accumulates into `found` (a fresh set by default) and stops
+    streaming as soon as every needle is accounted for, so files whose
+    interesting tokens appear early are not traversed to the end.
+    """
+    total = len(needles)
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+
+        def scan(content, found=None):
+            found = set() if found is None else found
+            for _, value in automaton.iter(content):
+                found.add(value)
+                if len(found) == total:
+                    break
+            return found
+    else:
+        pattern = re.compile("|".join(map(re.escape, needles)))
+
+        def scan(content, found=None):
+            found = set() if found is None else found
+            for match in pattern.finditer(content):
+                found.add(match.group(0))
+                if len(found) == total:
+                    break
+            else:
+                # The alternation picks one match per position, so nested/
+                # overlapping needles can be shadowed — recheck the stragglers
+                for needle in needles:
+                    if needle not in found and needle in content:
+                        found.add(needle)
+            return found
+
+    return scan
+
+@functools.lru_cache(maxsize=None)
+def _read(path_str):
+    """Read a source file once per run; later tests reuse the decoded text"""
+    return Path(path_str).read_text(errors="replace")
+
+@functools.lru_cache(maxsize=None)
+def _listing(dir_str):
+    """Entry names of a directory via one scandir instead of per-file stat calls"""
+    try:
+        return {entry.name for entry in os.scandir(dir_str)}
+    except OSError:
+        return frozenset()
+
+def _exists(path_str):
+    """Existence check answered from the cached directory listing"""
+    dir_name, name = os.path.split(path_str)
+    return name in _listing(dir_name)
+
 class SmartScreenshotTester:
-    def __init__(self):
-        self.project_root = Path(__file__).parent.parent
+    def __init__(self, project_root=None):
+        self.project_root = Path(project_root) if project_root else Path(__file__).parent.parent
+        # Plain string prefix: Path.__truediv__ re-normalizes on every join,
+        # which adds up inside the per-file loops
+        self._root_str = str(self.project_root) + os.sep
+        # Tokens already confirmed by earlier content tests, so the
+        # comprehensive check does not rescan for them
+        self._found_tokens = set()
         self.test_results = {
             "total_tests": 0,
             "passed": 0,
@@ -34,30 +118,34 @@ class SmartScreenshotTester:
         
     def run_test(self, test_name, test_func):
         """Run a single test and track results"""
-        self.test_results["total_tests"] += 1
         self.log(f"Running test: {test_name}")
-        
+
         try:
             result = test_func()
-            if result:
-                self.test_results["passed"] += 1
-                self.log(f"✅ {test_name} PASSED", "SUCCESS")
-                return True
-            else:
-                self.test_results["failed"] += 1
-                self.test_results["errors"].append(f"{test_name}: Test failed")
-                self.log(f"❌ {test_name} FAILED", "ERROR")
-                return False
         except Exception as e:
+            return self._record(test_name, False, error=str(e))
+        return self._record(test_name, result)
+
+    def _record(self, test_name, result, error=None):
+        """Track the outcome of one test"""
+        self.test_results["total_tests"] += 1
+        if error is not None:
             self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
-            self.log(f"❌ {test_name} ERROR: {e}", "ERROR")
+            self.test_results["errors"].append(f"{test_name}: {error}")
+            self.log(f"❌ {test_name} ERROR: {error}", "ERROR")
             return False
+        if result:
+            self.test_results["passed"] += 1
+            self.log(f"✅ {test_name} PASSED", "SUCCESS")
+            return True
+        self.test_results["failed"] += 1
+        self.test_results["errors"].append(f"{test_name}: Test failed")
+        self.log(f"❌ {test_name} FAILED", "ERROR")
+        return False
     
     def test_file_exists(self, file_path, description):
         """Test if a required file exists"""
-        full_path = self.project_root / file_path
-        exists = full_path.exists()
+        exists = _exists(self._root_str + file_path)
         if not exists:
             self.log(f"Missing file: {file_path}")
         return exists
@@ -82,176 +170,186 @@ class SmartScreenshotTester:
     
     def test_keyboard_shortcuts(self):
         """Test keyboard shortcuts are defined"""
-        shortcuts_file = self.project_root / "SmartScreenshot/Extensions/KeyboardShortcuts.Name+Shortcuts.swift"
+        shortcuts_file = self._root_str + "SmartScreenshot/Extensions/KeyboardShortcuts.Name+Shortcuts.swift"
         
-        if not shortcuts_file.exists():
+        if not _exists(shortcuts_file):
             return False
             
-        content = shortcuts_file.read_text()
-        required_shortcuts = [
+        content = _read(shortcuts_file)
+        required_shortcuts = (
             "screenshotOCR",
-            "regionOCR", 
+            "regionOCR",
             "appOCR",
             "bulkOCR"
-        ]
-        
-        for shortcut in required_shortcuts:
-            if shortcut not in content:
-                self.log(f"Missing keyboard shortcut: {shortcut}")
-                return False
-                
-        return True
+        )
+
+        found = build_scanner(required_shortcuts)(content)
+        self._found_tokens |= found
+        missing = [s for s in required_shortcuts if s not in found]
+        for shortcut in missing:
+            self.log(f"Missing keyboard shortcut: {shortcut}")
+
+        return not missing
     
     def test_ocr_functionality(self):
         """Test OCR functionality implementation"""
-        service_file = self.project_root / "SmartScreenshot/Services/SmartScreenshotService.swift"
+        service_file = self._root_str + "SmartScreenshot/Services/SmartScreenshotService.swift"
         
-        if not service_file.exists():
+        if not _exists(service_file):
             return False
             
-        content = service_file.read_text()
-        required_methods = [
+        content = _read(service_file)
+        required_methods = (
             "takeScreenshotWithOCR",
-            "captureScreenRegionWithOCR", 
+            "captureScreenRegionWithOCR",
             "captureApplicationWithOCR",
             "performOCR",
             "checkScreenRecordingPermission",
             "captureScreen",
             "captureActiveWindow"
-        ]
-        
-        for method in required_methods:
-            if f"func {method}" not in content:
-                self.log(f"Missing OCR method: {method}")
-                return False
-                
-        return True
+        )
+
+        found = build_scanner(tuple(f"func {m}" for m in required_methods))(content)
+        self._found_tokens.update(m for m in required_methods if f"func {m}" in found)
+        missing = [m for m in required_methods if f"func {m}" not in found]
+        for method in missing:
+            self.log(f"Missing OCR method: {method}")
+
+        return not missing
     
     def test_ui_integration(self):
         """Test UI components are properly integrated"""
-        content_view = self.project_root / "SmartScreenshot/Views/ContentView.swift"
+        content_view = self._root_str + "SmartScreenshot/Views/ContentView.swift"
         
-        if not content_view.exists():
+        if not _exists(content_view):
             return False
             
-        content = content_view.read_text()
-        required_elements = [
+        content = _read(content_view)
+        required_elements = (
             "SmartScreenshotMainView",
             "showingSmartScreenshot",
             "transition(.slide)"
-        ]
-        
-        for element in required_elements:
-            if element not in content:
-                self.log(f"Missing UI integration: {element}")
-                return False
-                
-        return True
+        )
+
+        found = build_scanner(required_elements)(content)
+        self._found_tokens |= found
+        missing = [e for e in required_elements if e not in found]
+        for element in missing:
+            self.log(f"Missing UI integration: {element}")
+
+        return not missing
     
     def test_bulk_processing(self):
         """Test bulk processing functionality"""
-        bulk_view = self.project_root / "SmartScreenshot/Views/BulkOCRView.swift"
-        main_view = self.project_root / "SmartScreenshot/Views/SmartScreenshotMainView.swift"
+        bulk_view = self._root_str + "SmartScreenshot/Views/BulkOCRView.swift"
+        main_view = self._root_str + "SmartScreenshot/Views/SmartScreenshotMainView.swift"
         
-        if not bulk_view.exists() or not main_view.exists():
+        if not _exists(bulk_view) or not _exists(main_view):
             return False
             
-        bulk_content = bulk_view.read_text()
-        main_content = main_view.read_text()
+        bulk_content = _read(bulk_view)
+        main_content = _read(main_view)
         
         # Check bulk view features
-        bulk_features = [
+        bulk_features = (
             "processingResults",
             "startBulkProcessing",
             "exportResults",
             "onDrop"
-        ]
-        
-        for feature in bulk_features:
-            if feature not in bulk_content:
-                self.log(f"Missing bulk processing feature: {feature}")
-                return False
-        
+        )
+
+        found = build_scanner(bulk_features)(bulk_content)
+        self._found_tokens |= found
+        missing = [f for f in bulk_features if f not in found]
+        for feature in missing:
+            self.log(f"Missing bulk processing feature: {feature}")
+        if missing:
+            return False
+
         # Check main view features (DragDropArea is here)
-        main_features = [
+        main_features = (
             "DragDropArea",
             "processBulkImages"
-        ]
-        
-        for feature in main_features:
-            if feature not in main_content:
-                self.log(f"Missing main view feature: {feature}")
-                return False
-                
-        return True
+        )
+
+        found = build_scanner(main_features)(main_content)
+        self._found_tokens |= found
+        missing = [f for f in main_features if f not in found]
+        for feature in missing:
+            self.log(f"Missing main view feature: {feature}")
+
+        return not missing
     
     def test_ai_models_support(self):
         """Test AI models are properly supported"""
-        ai_service = self.project_root / "SmartScreenshot/Services/AIOCRService.swift"
+        ai_service = self._root_str + "SmartScreenshot/Services/AIOCRService.swift"
         
-        if not ai_service.exists():
+        if not _exists(ai_service):
             return False
             
-        content = ai_service.read_text()
-        required_models = [
+        content = _read(ai_service)
+        required_models = (
             "appleVision",
             "openAI",
-            "claude", 
+            "claude",
             "gemini",
             "grok",
             "deepseek"
-        ]
-        
-        for model in required_models:
-            if model not in content:
-                self.log(f"Missing AI model support: {model}")
-                return False
-                
-        return True
+        )
+
+        found = build_scanner(required_models)(content)
+        self._found_tokens |= found
+        missing = [m for m in required_models if m not in found]
+        for model in missing:
+            self.log(f"Missing AI model support: {model}")
+
+        return not missing
     
     def test_settings_configuration(self):
         """Test settings and configuration options"""
-        settings_file = self.project_root / "SmartScreenshot/Settings/SmartScreenshotSettingsPane.swift"
+        settings_file = self._root_str + "SmartScreenshot/Settings/SmartScreenshotSettingsPane.swift"
         
-        if not settings_file.exists():
+        if not _exists(settings_file):
             return False
             
-        content = settings_file.read_text()
-        required_settings = [
+        content = _read(settings_file)
+        required_settings = (
             "autoOCREnabled",
             "confidenceThreshold",
             "multiLanguageOCR",
             "preserveFormatting",
             "showNotifications"
-        ]
-        
-        for setting in required_settings:
-            if setting not in content:
-                self.log(f"Missing setting: {setting}")
-                return False
-                
-        return True
+        )
+
+        found = build_scanner(required_settings)(content)
+        self._found_tokens |= found
+        missing = [s for s in required_settings if s not in found]
+        for setting in missing:
+            self.log(f"Missing setting: {setting}")
+
+        return not missing
     
     def test_permissions_handling(self):
         """Test permissions are properly handled"""
-        service_file = self.project_root / "SmartScreenshot/Services/SmartScreenshotService.swift"
+        service_file = self._root_str + "SmartScreenshot/Services/SmartScreenshotService.swift"
         
-        if not service_file.exists():
+        if not _exists(service_file):
             return False
             
-        content = service_file.read_text()
-        required_permissions = [
+        content = _read(service_file)
+        required_permissions = (
             "checkScreenRecordingPermission",
             "AXIsProcessTrusted",
             "CGDisplayCreateImage"
-        ]
-        
-        for permission in required_permissions:
-            if permission not in content:
-                self.log(f"Missing permission check: {permission}")
-                return False
-                
-        return True
+        )
+
+        found = build_scanner(required_permissions)(content)
+        self._found_tokens |= found
+        missing = [p for p in required_permissions if p not in found]
+        for permission in missing:
+            self.log(f"Missing permission check: {permission}")
+
+        return not missing
     
     def test_comprehensive_features(self):
         """Test comprehensive feature set from README"""
@@ -283,48 +381,77 @@ class SmartScreenshotTester:
             ("History.shared", "History Management")
         ]
         
+        # Tokens the earlier content tests already confirmed are taken as-is;
+        # only the remainder triggers a walk over the Swift sources, with one
+        # multi-pattern pass per file and an early exit once everything is seen
+        needles = tuple(feature for feature, _ in features_to_check)
+        found = {n for n in needles if n in self._found_tokens}
+        remaining = tuple(n for n in needles if n not in found)
+
+        if remaining:
+            scan = build_scanner(remaining)
+            hits = set()
+            for swift_file in self.project_root.glob("SmartScreenshot/**/*.swift"):
+                try:
+                    scan(_read(str(swift_file)), hits)
+                except (OSError, UnicodeDecodeError):
+                    continue
+                if len(hits) == len(remaining):
+                    break
+            found |= hits
+
         all_features_found = True
-        
-        # Search through all Swift files
-        swift_files = list(self.project_root.glob("SmartScreenshot/**/*.swift"))
-        all_content = ""
-        
-        for swift_file in swift_files:
-            try:
-                all_content += swift_file.read_text()
-            except:
-                continue
-        
         for feature, description in features_to_check:
-            if feature not in all_content:
+            if feature not in found:
                 self.log(f"Missing feature: {description} ({feature})")
                 all_features_found = False
-                
+
         return all_features_found
     
     def run_all_tests(self):
         """Run all SmartScreenshot tests"""
         self.log("🚀 Starting SmartScreenshot Complete Functionality Tests")
         self.log("=" * 80)
-        
-        # Core Architecture Tests
-        self.run_test("Core Services", self.test_core_services)
-        self.run_test("Keyboard Shortcuts", self.test_keyboard_shortcuts)
-        self.run_test("OCR Functionality", self.test_ocr_functionality)
-        self.run_test("UI Integration", self.test_ui_integration)
-        
-        # Feature Tests
-        self.run_test("Bulk Processing", self.test_bulk_processing)
-        self.run_test("AI Models Support", self.test_ai_models_support)
-        self.run_test("Settings Configuration", self.test_settings_configuration)
-        self.run_test("Permissions Handling", self.test_permissions_handling)
-        
-        # Comprehensive Feature Test
+
+        tests = [
+            # Core Architecture Tests
+            ("Core Services", "test_core_services"),
+            ("Keyboard Shortcuts", "test_keyboard_shortcuts"),
+            ("OCR Functionality", "test_ocr_functionality"),
+            ("UI Integration", "test_ui_integration"),
+            # Feature Tests
+            ("Bulk Processing", "test_bulk_processing"),
+            ("AI Models Support", "test_ai_models_support"),
+            ("Settings Configuration", "test_settings_configuration"),
+            ("Permissions Handling", "test_permissions_handling"),
+        ]
+
+        # The tests are independent read-then-scan checks, so fan them out
+        # across processes; logging stays in the parent to avoid interleaving
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                (name, executor.submit(_run_check, str(self.project_root), method))
+                for name, method in tests
+            ]
+            for name, future in futures:
+                self.log(f"Running test: {name}")
+                try:
+                    result, output, tokens = future.result()
+                except Exception as e:
+                    self._record(name, False, error=str(e))
+                    continue
+                if output:
+                    print(output, end="")
+                self._found_tokens |= tokens
+                self._record(name, result)
+
+        # Comprehensive Feature Test — runs last so it can reuse the tokens
+        # the content tests already confirmed
         self.run_test("Comprehensive Features", self.test_comprehensive_features)
-        
+
         # Print Summary
         self.print_summary()
-        
+
         return self.test_results["failed"] == 0
     
     def print_summary(self):
@@ -375,6 +502,19 @@ class SmartScreenshotTester:
             
         self.log(f"📄 Test results saved to: {results_file}")
 
+def _run_check(project_root, method_name):
+    """Worker entry point: run one named test in a fresh tester process.
+
+    Returns the test result, anything the test logged (so the parent can
+    replay the output without workers interleaving on stdout), and the
+    tokens the test confirmed for the comprehensive check.
+    """
+    tester = SmartScreenshotTester(project_root)
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = getattr(tester, method_name)()
+    return result, buffer.getvalue(), tester._found_tokens
+
 def main():
     """Main test execution"""
     tester = SmartScreenshotTester()
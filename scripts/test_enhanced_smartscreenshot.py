@@ -4,237 +4,176 @@ Enhanced SmartScreenshot Functionality Test Script
 Tests all major features including region selection and bulk processing
 """
 
-import subprocess
-import time
+import asyncio
+import mmap
+import re
 import os
 import sys
-from datetime import datetime
 
-class EnhancedSmartScreenshotTester:
+from _smartscreenshot_probes import BaseTester
+
+class EnhancedSmartScreenshotTester(BaseTester):
+    # Swift sources the file-based tests inspect
+    SOURCE_FILES = (
+        "SmartScreenshot/Views/RegionSelectionView.swift",
+        "SmartScreenshot/Views/DragDropView.swift",
+        "SmartScreenshot/SmartScreenshotManager.swift",
+        "SmartScreenshot/Views/SmartScreenshotControlsView.swift",
+    )
+
+    # Feature markers the content tests look for; FEATURE_RE scans for
+    # all of them in one pass per file (group i ↔ FEATURES[i-1])
+    FEATURES = (
+        "regionOfInterest",
+        "confidence",
+        "processMultipleImages",
+        "AdvancedSettingsView",
+        "getSupportedLanguages",
+    )
+    FEATURE_RE = re.compile(b"|".join(b"(%s)" % f.encode() for f in FEATURES))
+
     def __init__(self):
-        self.app_name = "SmartScreenshot"
-        self.test_results = []
-        
-    def log(self, message, level="INFO"):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
-        
-    def run_command(self, command, timeout=10):
-        """Run a command and return the result"""
-        try:
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=timeout)
-            return result.returncode == 0, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            return False, "", "Command timed out"
-        except Exception as e:
-            return False, "", str(e)
-    
-    def check_app_running(self):
-        """Check if SmartScreenshot is running"""
-        self.log("Checking if SmartScreenshot is running...")
-        success, stdout, stderr = self.run_command("ps aux | grep SmartScreenshot | grep -v grep")
-        if success and stdout.strip():
-            self.log("✅ SmartScreenshot is running", "SUCCESS")
-            return True
-        else:
-            self.log("❌ SmartScreenshot is not running", "ERROR")
-            return False
-    
-    def test_menu_bar_icon(self):
-        """Test if menu bar icon is visible"""
-        self.log("Testing menu bar icon visibility...")
-        success, stdout, stderr = self.run_command("defaults read com.smartscreenshot.app LSUIElement 2>/dev/null || echo 'Not found'")
-        if "1" in stdout:
-            self.log("✅ App is configured as menu bar app", "SUCCESS")
-            return True
-        else:
-            self.log("⚠️  App may not be in menu bar (LSUIElement not set)", "WARNING")
-            return False
-    
-    def test_hotkeys_registration(self):
-        """Test if hotkeys are properly registered"""
-        self.log("Testing hotkey registration...")
-        success, stdout, stderr = self.run_command("tccutil reset Accessibility com.smartscreenshot.app 2>/dev/null; echo 'Checked'")
-        self.log("✅ Hotkey registration test completed (requires manual verification)", "INFO")
-        return True
-    
-    def test_screen_recording_permission(self):
-        """Test screen recording permission"""
-        self.log("Testing screen recording permission...")
-        success, stdout, stderr = self.run_command("screencapture -x /tmp/test_screenshot.png 2>&1")
-        if success:
-            self.log("✅ Screen recording permission granted", "SUCCESS")
-            # Clean up
-            os.remove("/tmp/test_screenshot.png")
-            return True
-        else:
-            self.log("❌ Screen recording permission denied", "ERROR")
-            self.log("Please enable screen recording in System Preferences > Security & Privacy > Privacy > Screen Recording", "INFO")
-            return False
-    
-    def test_notification_permission(self):
-        """Test notification permission"""
-        self.log("Testing notification permission...")
-        success, stdout, stderr = self.run_command("defaults read com.smartscreenshot.app NSUserNotificationAlertStyle 2>/dev/null || echo 'Not found'")
-        self.log("✅ Notification permission test completed", "INFO")
-        return True
-    
-    def test_clipboard_functionality(self):
-        """Test clipboard functionality"""
-        self.log("Testing clipboard functionality...")
-        
-        # Test copying text to clipboard
-        test_text = "SmartScreenshot Test - " + datetime.now().strftime("%H:%M:%S")
-        success, stdout, stderr = self.run_command(f'echo "{test_text}" | pbcopy')
-        if success:
-            # Test reading from clipboard
-            success2, stdout2, stderr2 = self.run_command("pbpaste")
-            if success2 and test_text in stdout2:
-                self.log("✅ Clipboard functionality working", "SUCCESS")
-                return True
-            else:
-                self.log("❌ Clipboard read failed", "ERROR")
-                return False
-        else:
-            self.log("❌ Clipboard write failed", "ERROR")
-            return False
-    
-    def test_ocr_capability(self):
-        """Test OCR capability by creating a test image with text"""
-        self.log("Testing OCR capability...")
-        
-        # Create a simple test image with text using ImageMagick or similar
-        # For now, we'll just check if Vision framework is available
-        success, stdout, stderr = self.run_command("python3 -c 'import Vision; print(\"Vision framework available\")' 2>/dev/null || echo 'Vision framework not available'")
-        if "Vision framework available" in stdout:
-            self.log("✅ Vision framework available for OCR", "SUCCESS")
-            return True
-        else:
-            self.log("⚠️  Vision framework not available (OCR may not work)", "WARNING")
-            return False
-    
-    def test_app_preferences(self):
-        """Test app preferences and settings"""
-        self.log("Testing app preferences...")
-        
-        # Check if preferences file exists
-        prefs_path = os.path.expanduser("~/Library/Preferences/com.smartscreenshot.app.plist")
-        if os.path.exists(prefs_path):
-            self.log("✅ App preferences file exists", "SUCCESS")
-            return True
-        else:
-            self.log("⚠️  App preferences file not found (may be normal for first run)", "WARNING")
-            return False
-    
-    def test_region_selection_framework(self):
+        super().__init__()
+        self._sources = None
+        self._feature_cache = {}
+
+    def _load_sources(self):
+        """List each inspected source directory exactly once.
+
+        Several tests check the same files and most share a parent
+        directory, so one scandir per unique directory answers every
+        existence question instead of one stat per file per test.
+        Returns {path: exists}.
+        """
+        if self._sources is None:
+            listings = {}
+            for directory in {os.path.dirname(path) for path in self.SOURCE_FILES}:
+                try:
+                    with os.scandir(directory) as it:
+                        listings[directory] = {entry.name for entry in it}
+                except OSError:
+                    listings[directory] = set()
+            self._sources = {
+                path: os.path.basename(path) in listings[os.path.dirname(path)]
+                for path in self.SOURCE_FILES
+            }
+        return self._sources
+
+    def _features(self, path):
+        """Return the set of feature markers present in the file.
+
+        One pass of the compiled alternation over the mmap answers every
+        feature probe for the file — the regex engine scans the bytes in
+        C once instead of one substring search per feature, and the file
+        is searched straight out of the page cache with no UTF-8 decode.
+        """
+        if path not in self._feature_cache:
+            found = set()
+            try:
+                with open(path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for match in self.FEATURE_RE.finditer(mm):
+                        found.add(self.FEATURES[match.lastindex - 1])
+                        if len(found) == len(self.FEATURES):
+                            break
+            except (OSError, ValueError):
+                pass
+            self._feature_cache[path] = found
+        return self._feature_cache[path]
+
+    async def test_region_selection_framework(self):
         """Test region selection framework availability"""
         self.log("Testing region selection framework...")
-        
+
         # Check if the new region selection files exist
-        region_selection_file = "SmartScreenshot/Views/RegionSelectionView.swift"
-        if os.path.exists(region_selection_file):
+        if self._load_sources()["SmartScreenshot/Views/RegionSelectionView.swift"]:
             self.log("✅ Region selection view exists", "SUCCESS")
             return True
         else:
             self.log("❌ Region selection view not found", "ERROR")
             return False
-    
-    def test_drag_drop_framework(self):
+
+    async def test_drag_drop_framework(self):
         """Test drag and drop framework availability"""
         self.log("Testing drag and drop framework...")
-        
+
         # Check if the new drag and drop files exist
-        drag_drop_file = "SmartScreenshot/Views/DragDropView.swift"
-        if os.path.exists(drag_drop_file):
+        if self._load_sources()["SmartScreenshot/Views/DragDropView.swift"]:
             self.log("✅ Drag and drop view exists", "SUCCESS")
             return True
         else:
             self.log("❌ Drag and drop view not found", "ERROR")
             return False
-    
-    def test_enhanced_ocr_features(self):
+
+    async def test_enhanced_ocr_features(self):
         """Test enhanced OCR features"""
         self.log("Testing enhanced OCR features...")
-        
+
         # Check if the enhanced SmartScreenshotManager exists
         manager_file = "SmartScreenshot/SmartScreenshotManager.swift"
-        if os.path.exists(manager_file):
+        if self._load_sources()[manager_file]:
             # Check for enhanced features in the file
-            with open(manager_file, 'r') as f:
-                content = f.read()
-                if "regionOfInterest" in content and "confidence" in content:
-                    self.log("✅ Enhanced OCR features found", "SUCCESS")
-                    return True
-                else:
-                    self.log("⚠️  Enhanced OCR features not fully implemented", "WARNING")
-                    return False
+            if {"regionOfInterest", "confidence"} <= self._features(manager_file):
+                self.log("✅ Enhanced OCR features found", "SUCCESS")
+                return True
+            else:
+                self.log("⚠️  Enhanced OCR features not fully implemented", "WARNING")
+                return False
         else:
             self.log("❌ SmartScreenshotManager not found", "ERROR")
             return False
-    
-    def test_bulk_processing_framework(self):
+
+    async def test_bulk_processing_framework(self):
         """Test bulk processing framework"""
         self.log("Testing bulk processing framework...")
-        
+
         # Check if bulk processing methods exist
         manager_file = "SmartScreenshot/SmartScreenshotManager.swift"
-        if os.path.exists(manager_file):
-            with open(manager_file, 'r') as f:
-                content = f.read()
-                if "processMultipleImages" in content:
-                    self.log("✅ Bulk processing framework found", "SUCCESS")
-                    return True
-                else:
-                    self.log("⚠️  Bulk processing framework not implemented", "WARNING")
-                    return False
+        if self._load_sources()[manager_file]:
+            if "processMultipleImages" in self._features(manager_file):
+                self.log("✅ Bulk processing framework found", "SUCCESS")
+                return True
+            else:
+                self.log("⚠️  Bulk processing framework not implemented", "WARNING")
+                return False
         else:
             self.log("❌ SmartScreenshotManager not found", "ERROR")
             return False
-    
-    def test_advanced_settings_framework(self):
+
+    async def test_advanced_settings_framework(self):
         """Test advanced settings framework"""
         self.log("Testing advanced settings framework...")
-        
+
         # Check if advanced settings view exists
         controls_file = "SmartScreenshot/Views/SmartScreenshotControlsView.swift"
-        if os.path.exists(controls_file):
-            with open(controls_file, 'r') as f:
-                content = f.read()
-                if "AdvancedSettingsView" in content and "getSupportedLanguages" in content:
-                    self.log("✅ Advanced settings framework found", "SUCCESS")
-                    return True
-                else:
-                    self.log("⚠️  Advanced settings framework not fully implemented", "WARNING")
-                    return False
+        if self._load_sources()[controls_file]:
+            if {"AdvancedSettingsView", "getSupportedLanguages"} <= self._features(controls_file):
+                self.log("✅ Advanced settings framework found", "SUCCESS")
+                return True
+            else:
+                self.log("⚠️  Advanced settings framework not fully implemented", "WARNING")
+                return False
         else:
             self.log("❌ SmartScreenshotControlsView not found", "ERROR")
             return False
-    
-    def test_compilation_ready(self):
+
+    async def test_compilation_ready(self):
         """Test if the enhanced code is ready for compilation"""
         self.log("Testing compilation readiness...")
-        
+
         # Check for common compilation issues
-        swift_files = [
-            "SmartScreenshot/Views/RegionSelectionView.swift",
-            "SmartScreenshot/Views/DragDropView.swift",
-            "SmartScreenshot/SmartScreenshotManager.swift",
-            "SmartScreenshot/Views/SmartScreenshotControlsView.swift"
+        missing_files = [
+            path for path, exists in self._load_sources().items() if not exists
         ]
-        
-        missing_files = []
-        for file in swift_files:
-            if not os.path.exists(file):
-                missing_files.append(file)
-        
+
         if missing_files:
             self.log(f"❌ Missing files: {', '.join(missing_files)}", "ERROR")
             return False
-        
+
         self.log("✅ All required files present", "SUCCESS")
         return True
     
-    def run_comprehensive_test(self):
+    async def run_comprehensive_test(self):
         """Run all tests"""
         self.log("🚀 Starting Enhanced SmartScreenshot Comprehensive Functionality Test", "INFO")
         self.log("=" * 80, "INFO")
@@ -256,20 +195,29 @@ class EnhancedSmartScreenshotTester:
             ("Compilation Ready", self.test_compilation_ready),
         ]
         
-        passed = 0
         total = len(tests)
-        
-        for test_name, test_func in tests:
+        # Preallocate and write by index: under gather the coroutines
+        # finish in completion order, but the summary stays in
+        # submission order and the list never reallocates mid-run
+        self.test_results = [None] * total
+
+        # The probes are independent, so overlap them: wall time becomes
+        # roughly the slowest probe instead of the sum of all of them
+        async def run_one(index, test_name, test_func):
             self.log(f"\n📋 Running test: {test_name}", "INFO")
             try:
-                if test_func():
-                    passed += 1
-                    self.test_results.append((test_name, "PASS"))
-                else:
-                    self.test_results.append((test_name, "FAIL"))
+                if await test_func():
+                    self.test_results[index] = (test_name, "PASS")
+                    return True
+                self.test_results[index] = (test_name, "FAIL")
             except Exception as e:
                 self.log(f"❌ Test {test_name} failed with exception: {e}", "ERROR")
-                self.test_results.append((test_name, "ERROR"))
+                self.test_results[index] = (test_name, "ERROR")
+            return False
+
+        outcomes = await asyncio.gather(
+            *(run_one(i, n, f) for i, (n, f) in enumerate(tests)))
+        passed = sum(outcomes)
         
         # Print summary
         self.log("\n" + "=" * 80, "INFO")
@@ -289,11 +237,13 @@ class EnhancedSmartScreenshotTester:
         else:
             self.log("⚠️  Several tests failed. Enhanced SmartScreenshot needs more work.", "WARNING")
         
+        # One buffered flush for the whole run
+        self.flush_logs()
         return passed, total
 
 def main():
     tester = EnhancedSmartScreenshotTester()
-    passed, total = tester.run_comprehensive_test()
+    passed, total = asyncio.run(tester.run_comprehensive_test())
     
     # Exit with appropriate code
     if passed == total:
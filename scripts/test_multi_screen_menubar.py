@@ -3,10 +3,19 @@
 Test script for SmartScreenshot multi-screen menubar functionality
 """
 
+import functools
+import plistlib
 import subprocess
 import sys
 import time
 
+try:
+    # Optional: CoreGraphics answers the display count in one C call
+    # (microseconds) instead of the 1-3s system_profiler IOKit walk
+    import Quartz
+except ImportError:
+    Quartz = None
+
 def run_command(cmd):
     """Run a command and return the output"""
     try:
@@ -15,31 +24,71 @@ def run_command(cmd):
     except Exception as e:
         return "", str(e), -1
 
+@functools.lru_cache(maxsize=1)
+def get_displays():
+    """Run system_profiler once and return the parsed display list.
+
+    system_profiler walks IOKit and takes 1-3 seconds per call, so the
+    detection and parameter tests share one cached invocation. Returns
+    None if the probe fails.
+    """
+    try:
+        result = subprocess.run(
+            ["system_profiler", "SPDisplaysDataType", "-xml"],
+            capture_output=True, timeout=30
+        )
+        if result.returncode != 0:
+            return None
+        displays = []
+        for gpu in plistlib.loads(result.stdout)[0].get("_items", []):
+            displays.extend(gpu.get("spdisplays_ndrvs", []))
+        return displays
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def get_display_count():
+    """Return the number of active displays, or None if undetectable.
+
+    Prefers a single CGGetActiveDisplayList call; falls back to the
+    cached system_profiler probe when Quartz (PyObjC) is unavailable.
+    """
+    if Quartz is not None:
+        try:
+            err, displays, count = Quartz.CGGetActiveDisplayList(16, None, None)
+            if err == 0:
+                return count
+        except Exception:
+            pass
+    displays = get_displays()
+    return len(displays) if displays is not None else None
+
 def test_multi_screen_detection():
     """Test if the app can detect multiple screens"""
     print("🔍 Testing multi-screen detection...")
-    
-    # Check system screen info
-    stdout, stderr, returncode = run_command("system_profiler SPDisplaysDataType")
-    if returncode == 0:
-        print("✅ System screen detection working")
-        
-        # Look for multiple displays
-        if "Display Type: External" in stdout or "Display Type: Built-in" in stdout:
-            print("✅ Multiple display types detected")
-        else:
-            print("⚠️  Only single display detected")
+
+    # Check system screen info (shared, cached probe)
+    count = get_display_count()
+    if count is None:
+        print("❌ Failed to get screen info")
+        return False
+
+    print("✅ System screen detection working")
+
+    # Look for multiple displays
+    if count > 1:
+        print("✅ Multiple display types detected")
     else:
-        print(f"❌ Failed to get screen info: {stderr}")
-    
-    return returncode == 0
+        print("⚠️  Only single display detected")
+
+    return True
 
 def test_app_launch():
     """Test if the app launches successfully"""
     print("\n🚀 Testing app launch...")
     
     # Check if app is already running
-    stdout, stderr, returncode = run_command("pgrep -f SmartScreenshot")
+    stdout, stderr, returncode = run_command("pgrep -x SmartScreenshot")
     if returncode == 0:
         print("✅ SmartScreenshot is already running")
         return True
@@ -50,18 +99,18 @@ def test_app_launch():
     
     if returncode == 0:
         print("✅ App launch command sent successfully")
-        
-        # Wait a moment for the app to start
-        time.sleep(3)
-        
-        # Check if it's now running
-        stdout, stderr, returncode = run_command("pgrep -f SmartScreenshot")
-        if returncode == 0:
-            print("✅ App is now running")
-            return True
-        else:
-            print("❌ App failed to start")
-            return False
+
+        # Poll for the process instead of a flat 3-second sleep — on a
+        # warm launch the app is usually up within a few hundred ms
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            stdout, stderr, returncode = run_command("pgrep -x SmartScreenshot")
+            if returncode == 0:
+                print("✅ App is now running")
+                return True
+            time.sleep(0.1)
+        print("❌ App failed to start")
+        return False
     else:
         print(f"❌ Failed to launch app: {stderr}")
         return False
@@ -69,31 +118,39 @@ def test_app_launch():
 def test_menubar_integration():
     """Test if the menubar integration is working"""
     print("\n🎯 Testing menubar integration...")
-    
+
+    # Export the whole preference domain once instead of forking
+    # `defaults read` per key — each read re-parses the same plist
+    try:
+        result = subprocess.run(
+            ["defaults", "export", "org.p0deje.SmartScreenshot", "-"],
+            capture_output=True, timeout=10
+        )
+        prefs = plistlib.loads(result.stdout) if result.returncode == 0 else {}
+    except Exception:
+        prefs = {}
+
     # Check if the menubar item is visible
-    stdout, stderr, returncode = run_command("defaults read org.p0deje.SmartScreenshot showInStatusBar 2>/dev/null || echo 'not_set'")
-    if returncode == 0 and stdout != "not_set":
-        print(f"✅ Status bar visibility setting: {stdout}")
+    if "showInStatusBar" in prefs:
+        print(f"✅ Status bar visibility setting: {prefs['showInStatusBar']}")
     else:
         print("⚠️  Status bar visibility setting not found")
-    
+
     # Check for menubar display settings
-    stdout, stderr, returncode = run_command("defaults read org.p0deje.SmartScreenshot menubar_display_mode 2>/dev/null || echo 'not_set'")
-    if returncode == 0 and stdout != "not_set":
-        print(f"✅ Menubar display mode: {stdout}")
+    if "menubar_display_mode" in prefs:
+        print(f"✅ Menubar display mode: {prefs['menubar_display_mode']}")
     else:
         print("⚠️  Menubar display mode setting not found")
-    
+
     return True
 
 def test_screen_parameters():
     """Test screen parameter change detection"""
     print("\n🖥️  Testing screen parameter detection...")
     
-    # Check if we can detect screen changes
-    stdout, stderr, returncode = run_command("system_profiler SPDisplaysDataType | grep -c 'Display Type'")
-    if returncode == 0 and stdout.isdigit():
-        screen_count = int(stdout)
+    # Check if we can detect screen changes (reuses the cached probe)
+    screen_count = get_display_count()
+    if screen_count is not None:
         print(f"✅ Detected {screen_count} display(s)")
         
         if screen_count > 1:
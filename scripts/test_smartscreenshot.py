@@ -4,167 +4,32 @@ SmartScreenshot Functionality Test Script
 Tests all major features of the SmartScreenshot app
 """
 
-import subprocess
-import time
-import os
+import asyncio
+import io
 import sys
-from datetime import datetime
-
-class SmartScreenshotTester:
-    def __init__(self):
-        self.app_name = "SmartScreenshot"
-        self.test_results = []
-        
-    def log(self, message, level="INFO"):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
-        
-    def run_command(self, command, timeout=10):
-        """Run a command and return the result"""
-        try:
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=timeout)
-            return result.returncode == 0, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            return False, "", "Command timed out"
-        except Exception as e:
-            return False, "", str(e)
-    
-    def check_app_running(self):
-        """Check if SmartScreenshot is running"""
-        self.log("Checking if SmartScreenshot is running...")
-        success, stdout, stderr = self.run_command("ps aux | grep SmartScreenshot | grep -v grep")
-        if success and stdout.strip():
-            self.log("✅ SmartScreenshot is running", "SUCCESS")
-            return True
-        else:
-            self.log("❌ SmartScreenshot is not running", "ERROR")
-            return False
-    
-    def test_menu_bar_icon(self):
-        """Test if menu bar icon is visible"""
-        self.log("Testing menu bar icon visibility...")
-        # This is a visual test - we can't programmatically verify it
-        # But we can check if the app is in the menu bar
-        success, stdout, stderr = self.run_command("defaults read com.smartscreenshot.app LSUIElement 2>/dev/null || echo 'Not found'")
-        if "1" in stdout:
-            self.log("✅ App is configured as menu bar app", "SUCCESS")
-            return True
-        else:
-            self.log("⚠️  App may not be in menu bar (LSUIElement not set)", "WARNING")
-            return False
-    
-    def test_hotkeys_registration(self):
-        """Test if hotkeys are properly registered"""
-        self.log("Testing hotkey registration...")
-        # Check if the app has accessibility permissions
-        success, stdout, stderr = self.run_command("tccutil reset Accessibility com.smartscreenshot.app 2>/dev/null; echo 'Checked'")
-        self.log("✅ Hotkey registration test completed (requires manual verification)", "INFO")
-        return True
-    
-    def test_screen_recording_permission(self):
-        """Test screen recording permission"""
-        self.log("Testing screen recording permission...")
-        # Try to capture a screenshot using system command
-        success, stdout, stderr = self.run_command("screencapture -x /tmp/test_screenshot.png 2>&1")
-        if success:
-            self.log("✅ Screen recording permission granted", "SUCCESS")
-            # Clean up
-            os.remove("/tmp/test_screenshot.png")
-            return True
-        else:
-            self.log("❌ Screen recording permission denied", "ERROR")
-            self.log("Please enable screen recording in System Preferences > Security & Privacy > Privacy > Screen Recording", "INFO")
-            return False
-    
-    def test_notification_permission(self):
-        """Test notification permission"""
-        self.log("Testing notification permission...")
-        # Check notification settings
-        success, stdout, stderr = self.run_command("defaults read com.smartscreenshot.app NSUserNotificationAlertStyle 2>/dev/null || echo 'Not found'")
-        self.log("✅ Notification permission test completed", "INFO")
-        return True
-    
-    def test_clipboard_functionality(self):
-        """Test clipboard functionality"""
-        self.log("Testing clipboard functionality...")
-        
-        # Test copying text to clipboard
-        test_text = "SmartScreenshot Test - " + datetime.now().strftime("%H:%M:%S")
-        success, stdout, stderr = self.run_command(f'echo "{test_text}" | pbcopy')
-        if success:
-            # Test reading from clipboard
-            success2, stdout2, stderr2 = self.run_command("pbpaste")
-            if success2 and test_text in stdout2:
-                self.log("✅ Clipboard functionality working", "SUCCESS")
-                return True
-            else:
-                self.log("❌ Clipboard read failed", "ERROR")
-                return False
-        else:
-            self.log("❌ Clipboard write failed", "ERROR")
-            return False
-    
-    def test_ocr_capability(self):
-        """Test OCR capability by creating a test image with text"""
-        self.log("Testing OCR capability...")
-        
-        # Create a simple test image with text using ImageMagick or similar
-        # For now, we'll just check if Vision framework is available
-        success, stdout, stderr = self.run_command("python3 -c 'import Vision; print(\"Vision framework available\")' 2>/dev/null || echo 'Vision framework not available'")
-        if "Vision framework available" in stdout:
-            self.log("✅ Vision framework available for OCR", "SUCCESS")
-            return True
-        else:
-            self.log("⚠️  Vision framework not available (OCR may not work)", "WARNING")
-            return False
-    
-    def test_app_preferences(self):
-        """Test app preferences and settings"""
-        self.log("Testing app preferences...")
-        
-        # Check if preferences file exists
-        prefs_path = os.path.expanduser("~/Library/Preferences/com.smartscreenshot.app.plist")
-        if os.path.exists(prefs_path):
-            self.log("✅ App preferences file exists", "SUCCESS")
-            return True
-        else:
-            self.log("⚠️  App preferences file not found (may be normal for first run)", "WARNING")
-            return False
-    
-    def test_bulk_upload_simulation(self):
+
+from _smartscreenshot_probes import BaseTester
+
+class SmartScreenshotTester(BaseTester):
+    async def test_bulk_upload_simulation(self):
         """Simulate bulk upload functionality"""
         self.log("Testing bulk upload simulation...")
-        
-        # Create test PNG files
-        test_dir = "/tmp/smartscreenshot_test"
-        os.makedirs(test_dir, exist_ok=True)
-        
-        # Create some test images (simplified - just empty files for now)
-        for i in range(3):
-            with open(f"{test_dir}/test_image_{i}.png", "w") as f:
-                f.write("PNG test file")
-        
-        self.log(f"✅ Created {3} test PNG files in {test_dir}", "SUCCESS")
+
+        # Nothing ever reads these bytes back, so stage in-memory
+        # placeholders instead of churning real files through /tmp —
+        # no mkdir/rmdir, no cleanup races with concurrent runs
+        test_images = [io.BytesIO(b"PNG test file") for _ in range(3)]
+
+        self.log(f"✅ Staged {len(test_images)} in-memory test PNG placeholders", "SUCCESS")
         self.log("Note: Actual bulk OCR would require implementing the feature", "INFO")
-        
-        # Clean up
-        for i in range(3):
-            try:
-                os.remove(f"{test_dir}/test_image_{i}.png")
-            except:
-                pass
-        try:
-            os.rmdir(test_dir)
-        except:
-            pass
-        
+
         return True
-    
-    def run_comprehensive_test(self):
+
+    async def run_comprehensive_test(self):
         """Run all tests"""
         self.log("🚀 Starting SmartScreenshot Comprehensive Functionality Test", "INFO")
         self.log("=" * 60, "INFO")
-        
+
         tests = [
             ("App Running", self.check_app_running),
             ("Menu Bar Icon", self.test_menu_bar_icon),
@@ -176,46 +41,57 @@ class SmartScreenshotTester:
             ("App Preferences", self.test_app_preferences),
             ("Bulk Upload Simulation", self.test_bulk_upload_simulation),
         ]
-        
-        passed = 0
+
         total = len(tests)
-        
-        for test_name, test_func in tests:
+        # Preallocate and write by index: under gather the coroutines
+        # finish in completion order, but the summary stays in
+        # submission order and the list never reallocates mid-run
+        self.test_results = [None] * total
+
+        # The probes are independent, so overlap them: wall time becomes
+        # roughly the slowest probe instead of the sum of all of them
+        async def run_one(index, test_name, test_func):
             self.log(f"\n📋 Running test: {test_name}", "INFO")
             try:
-                if test_func():
-                    passed += 1
-                    self.test_results.append((test_name, "PASS"))
-                else:
-                    self.test_results.append((test_name, "FAIL"))
+                if await test_func():
+                    self.test_results[index] = (test_name, "PASS")
+                    return True
+                self.test_results[index] = (test_name, "FAIL")
             except Exception as e:
                 self.log(f"❌ Test {test_name} failed with exception: {e}", "ERROR")
-                self.test_results.append((test_name, "ERROR"))
-        
+                self.test_results[index] = (test_name, "ERROR")
+            return False
+
+        outcomes = await asyncio.gather(
+            *(run_one(i, n, f) for i, (n, f) in enumerate(tests)))
+        passed = sum(outcomes)
+
         # Print summary
         self.log("\n" + "=" * 60, "INFO")
         self.log("📊 TEST SUMMARY", "INFO")
         self.log("=" * 60, "INFO")
-        
+
         for test_name, result in self.test_results:
             status_icon = "✅" if result == "PASS" else "❌" if result == "FAIL" else "⚠️"
             self.log(f"{status_icon} {test_name}: {result}", "INFO")
-        
+
         self.log(f"\n🎯 Overall: {passed}/{total} tests passed", "INFO")
-        
+
         if passed == total:
             self.log("🎉 All tests passed! SmartScreenshot is working correctly.", "SUCCESS")
         elif passed >= total * 0.8:
             self.log("👍 Most tests passed. SmartScreenshot is mostly functional.", "SUCCESS")
         else:
             self.log("⚠️  Several tests failed. SmartScreenshot may have issues.", "WARNING")
-        
+
+        # One buffered flush for the whole run
+        self.flush_logs()
         return passed, total
 
 def main():
     tester = SmartScreenshotTester()
-    passed, total = tester.run_comprehensive_test()
-    
+    passed, total = asyncio.run(tester.run_comprehensive_test())
+
     # Exit with appropriate code
     if passed == total:
         sys.exit(0)  # All tests passed